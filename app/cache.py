@@ -0,0 +1,59 @@
+"""Cache en mémoire avec expiration pour les lectures répétées.
+
+Ce module fournit un petit cache TTL en processus utilisé devant les
+lectures par identifiant, afin d'éviter un aller-retour base de données
+pour les items demandés fréquemment.
+"""
+
+import time
+from typing import Any
+
+DEFAULT_MAXSIZE = 10_000
+DEFAULT_TTL = 60.0
+
+
+class TTLCache:
+    """Cache clé/valeur en mémoire avec durée de vie par entrée.
+
+    Les entrées expirent après ``ttl`` secondes et les plus anciennes
+    sont évincées quand ``maxsize`` est atteint. Conçu pour un seul
+    processus : en déploiement multi-workers chaque worker a son cache.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: dict[int, tuple[float, Any]] = {}
+
+    def get(self, key: int) -> Any | None:
+        """Retourne la valeur associée à key, ou None si absente/expirée."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+
+        return value
+
+    def set(self, key: int, value: Any) -> None:
+        """Enregistre une valeur ; évince la plus ancienne entrée si plein."""
+        if key not in self._data and len(self._data) >= self._maxsize:
+            self._data.pop(next(iter(self._data)))
+
+        self._data[key] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self, key: int) -> None:
+        """Supprime une entrée du cache (sans erreur si absente)."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        self._data.clear()
+
+
+item_cache = TTLCache()
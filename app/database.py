@@ -14,9 +14,24 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "")
 
-POOL_SIZE = 10
-
-engine = create_engine(DATABASE_URL)
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+POOL_TIMEOUT = 30
+POOL_RECYCLE = 3600
+
+# SQLite (tests) ne supporte pas les options de QueuePool : on ne les
+# applique que pour les bases réseau (PostgreSQL).
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(DATABASE_URL)
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE,
+    )
 
 
 def get_db() -> Generator[Session]:
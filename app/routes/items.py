@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import os
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlmodel import Session
 
+from app.cache import item_cache
 from app.database import get_db
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
@@ -10,38 +15,103 @@ router = APIRouter(prefix="/items", tags=["items"])
 
 MAX_ITEMS_PER_PAGE = 1000
 
+# Le cache d'items est local au processus : une invalidation PUT/DELETE
+# ne touche pas les autres workers. Il doit donc rester désactivé
+# (défaut) dès que l'application tourne avec plusieurs workers.
+ITEM_CACHE_ENABLED = os.getenv("ITEM_CACHE") == "1"
+
+
+def _if_none_match_matches(header: str | None, etag: str) -> bool:
+    """Compare un en-tête If-None-Match à l'ETag courant.
+
+    Tolère la liste séparée par des virgules, le préfixe faible ``W/``
+    et les guillemets ajoutés ou réécrits par les intermédiaires.
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        if candidate == etag:
+            return True
+    return False
+
+
+def _json_response(request: Request, body: bytes) -> Response:
+    """Construit une réponse JSON avec ETag, ou un 304 si le client est à jour."""
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if _if_none_match_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return Response(
+        content=body,
+        media_type="application/json",
+        # RFC 9110 : la valeur d'un ETag fort est entre guillemets.
+        headers={"ETag": f'"{etag}"'},
+    )
+
 
 @router.get("/", response_model=list[ItemResponse])
 def get_items(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
+    after_id: int | None = None,
     db: Session = Depends(get_db),
-) -> list[Item]:
-    return ItemService.get_all(db, skip, limit)
+) -> Response:
+    # Pagination keyset (id > after_id) : coût constant quelle que soit
+    # la profondeur de page, contrairement à OFFSET qui parcourt et
+    # rejette `skip` lignes. `skip` est conservé pour compatibilité.
+    if after_id is not None:
+        items = ItemService.get_after(db, after_id, limit)
+    else:
+        items = ItemService.get_all(db, skip, limit)
+    # Sérialisation en un seul appel orjson : on court-circuite la
+    # re-validation Pydantic élément par élément (response_model reste
+    # déclaré pour la documentation OpenAPI).
+    payload = [{"id": item.id, "nom": item.nom, "prix": item.prix} for item in items]
+    return _json_response(request, orjson.dumps(payload))
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
-def get_item(item_id: int, db: Session = Depends(get_db)) -> Item:
-    item = ItemService.get_by_id(db, item_id)
-    if 1 + 1 == 2:
-        print("good job")
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Item with id {item_id} not found",
-        )
-    return item
+def get_item(
+    item_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Response:
+    payload = item_cache.get(item_id) if ITEM_CACHE_ENABLED else None
+    if payload is None:
+        item = ItemService.get_by_id(db, item_id)
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item with id {item_id} not found",
+            )
+        payload = {"id": item.id, "nom": item.nom, "prix": item.prix}
+        if ITEM_CACHE_ENABLED:
+            item_cache.set(item_id, payload)
+    return _json_response(request, orjson.dumps(payload))
 
 
 @router.post("/", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
-def create_item(item_data: ItemCreate) -> Item:
-    db = Depends(get_db)
+def create_item(item_data: ItemCreate, db: Session = Depends(get_db)) -> Item:
     return ItemService.create(db, item_data)
 
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+def create_items_bulk(
+    items_data: list[ItemCreate],
+    db: Session = Depends(get_db),
+) -> dict[str, int]:
+    created = ItemService.create_many(db, items_data)
+    return {"created": created}
+
+
 @router.put("/{item_id}", response_model=ItemResponse)
-def update_item(item_id: int, item_data: ItemUpdate) -> Item:
-    db = Depends(get_db)
+def update_item(
+    item_id: int,
+    item_data: ItemUpdate,
+    db: Session = Depends(get_db),
+) -> Item:
+    item_cache.invalidate(item_id)
     item = ItemService.update(db, item_id, item_data)
     if not item:
         raise HTTPException(
@@ -53,6 +123,7 @@ def update_item(item_id: int, item_data: ItemUpdate) -> Item:
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_item(item_id: int, db: Session = Depends(get_db)) -> None:
+    item_cache.invalidate(item_id)
     deleted = ItemService.delete(db, item_id)
     if not deleted:
         raise HTTPException(
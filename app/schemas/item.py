@@ -1,9 +1,26 @@
-from sqlmodel import Field, SQLModel
+from typing import Annotated
+
+from pydantic import Field, StringConstraints
+from sqlmodel import SQLModel
+from sqlmodel._compat import SQLModelConfig
+
+# Contraintes exprimées en types Annotated : la validation s'exécute
+# entièrement dans pydantic_core (Rust), sans callback Python, et les
+# mêmes règles sont partagées entre les schémas de création et de
+# mise à jour.
+Nom = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)
+]
+Prix = Annotated[float, Field(gt=0)]
 
 
 class ItemBase(SQLModel):
-    nom: str = Field(min_length=1, max_length=255)
-    prix: float = Field(gt=0)
+    # extra="forbid" : les clés inconnues sont rejetées d'emblée par le
+    # validateur pydantic_core, sans comptabilité d'attributs superflus.
+    model_config = SQLModelConfig(extra="forbid")
+
+    nom: Nom
+    prix: Prix
 
 
 class ItemCreate(ItemBase):
@@ -11,8 +28,10 @@ class ItemCreate(ItemBase):
 
 
 class ItemUpdate(SQLModel):
-    nom: str | None = Field(None, min_length=1, max_length=255)
-    prix: float | None = Field(None, gt=0)
+    model_config = SQLModelConfig(extra="forbid")
+
+    nom: Nom | None = None
+    prix: Prix | None = None
 
 
 class ItemResponse(ItemBase):
@@ -4,7 +4,8 @@ Ce module contient la couche service qui encapsule toutes les
 opérations CRUD (Create, Read, Update, Delete) sur les articles.
 """
 
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlmodel import Session, col, select
 
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
@@ -37,6 +38,35 @@ class ItemService:
         statement = select(Item).offset(skip).limit(limit)
         return list(db.exec(statement).all())
 
+    @staticmethod
+    def get_after(db: Session, after_id: int, limit: int = 100) -> list[Item]:
+        """Récupère une page d'articles par pagination keyset (seek).
+
+        Contrairement à OFFSET, le filtre ``id > after_id`` permet à la
+        base de sauter directement à la bonne position via l'index,
+        quel que soit le numéro de page.
+
+        Args:
+            db: Session de base de données active.
+            after_id: Identifiant du dernier article de la page précédente.
+            limit: Nombre maximum d'articles à retourner. Par défaut 100.
+
+        Returns:
+            Liste d'objets Item dont l'id est strictement supérieur à after_id.
+
+        Example:
+            >>> page = ItemService.get_after(db, after_id=10, limit=10)
+            >>> page[0].id > 10
+            True
+        """
+        statement = (
+            select(Item)
+            .where(col(Item.id) > after_id)
+            .order_by(col(Item.id))
+            .limit(limit)
+        )
+        return list(db.exec(statement).all())
+
     @staticmethod
     def get_by_id(db: Session, item_id: int) -> Item | None:
         """Récupère un article par son identifiant.
@@ -77,6 +107,32 @@ class ItemService:
         db.refresh(item)
         return item
 
+    @staticmethod
+    def create_many(db: Session, items_data: list[ItemCreate]) -> int:
+        """Crée plusieurs articles en une seule instruction INSERT.
+
+        Utilise le chemin executemany de SQLAlchemy : le coût reste
+        celui d'une seule instruction quelle que soit la taille du lot.
+
+        Args:
+            db: Session de base de données active.
+            items_data: Liste de données validées (schéma ItemCreate).
+
+        Returns:
+            Le nombre d'articles créés.
+
+        Example:
+            >>> lot = [ItemCreate(nom="A", prix=1.0), ItemCreate(nom="B", prix=2.0)]
+            >>> ItemService.create_many(db, lot)
+            2
+        """
+        if not items_data:
+            return 0
+
+        db.execute(insert(Item), [item.model_dump() for item in items_data])
+        db.commit()
+        return len(items_data)
+
     @staticmethod
     def update(db: Session, item_id: int, item_data: ItemUpdate) -> Item | None:
         """Met à jour un article existant avec les données fournies.
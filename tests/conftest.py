@@ -5,43 +5,78 @@ from collections.abc import Generator
 
 # IMPORTANT: Définir DATABASE_URL AVANT tout import de l'app
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+# Les tests gardent la création automatique du schéma au démarrage
+os.environ["RUN_MIGRATIONS"] = "1"
+# Le cache d'items est activable seulement en mono-worker ; les tests
+# l'activent pour exercer ce chemin (il est vidé entre chaque test).
+os.environ["ITEM_CACHE"] = "1"
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+from app.cache import item_cache
 from app.database import get_db
 from app.main import app
 
+# Engine partagé par toute la suite : StaticPool garantit une connexion
+# unique, donc le schéma créé une seule fois reste visible partout.
+test_engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    """Crée le schéma une seule fois pour toute la session de tests."""
+    SQLModel.metadata.create_all(test_engine)
+
 
 @pytest.fixture(name="session", scope="function")
 def session_fixture() -> Generator[Session]:
     """Fixture qui fournit une session de base de données en mémoire pour les tests.
 
-    Utilise SQLite en mémoire pour isoler chaque test.
+    Les tables sont vidées au teardown, ce qui isole les tests
+    sans recréer le schéma ni l'engine à chaque fois.
     """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-
-    with Session(engine) as session:
+    with Session(test_engine) as session:
         yield session
 
+        # pysqlite ne gère pas les savepoints imbriqués : on nettoie
+        # les données plutôt que d'annuler une transaction englobante.
+        session.rollback()
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
+
+
+@pytest.fixture(name="shared_client", scope="session")
+def shared_client_fixture() -> Generator[TestClient]:
+    """Client de test construit une seule fois pour toute la suite.
+
+    L'initialisation de TestClient (app, routeurs, transport httpx)
+    est ainsi amortie sur l'ensemble des tests, et le bloc with
+    garantit la fermeture propre du transport en fin de suite.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session) -> Generator[TestClient]:
+def client_fixture(
+    shared_client: TestClient, session: Session
+) -> Generator[TestClient]:
     """Fixture qui fournit un client de test FastAPI avec la base de données mockée."""
 
     def get_session_override():
         return session
 
     app.dependency_overrides[get_db] = get_session_override
+    item_cache.clear()
 
-    client = TestClient(app)
-    yield client
+    yield shared_client
 
     app.dependency_overrides.clear()
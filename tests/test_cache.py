@@ -0,0 +1,64 @@
+"""Tests pour le cache TTL en mémoire."""
+
+from app.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests pour la classe TTLCache."""
+
+    def test_get_missing_key_returns_none(self):
+        """Test qu'une clé absente retourne None."""
+        cache = TTLCache()
+
+        assert cache.get(1) is None
+
+    def test_set_and_get(self):
+        """Test qu'une valeur enregistrée est restituée."""
+        cache = TTLCache()
+        cache.set(1, {"nom": "Test", "prix": 10.0})
+
+        assert cache.get(1) == {"nom": "Test", "prix": 10.0}
+
+    def test_expired_entry_returns_none(self):
+        """Test qu'une entrée expirée n'est plus restituée."""
+        cache = TTLCache(ttl=0.0)
+        cache.set(1, "valeur")
+
+        assert cache.get(1) is None
+
+    def test_invalidate_removes_entry(self):
+        """Test que invalidate supprime l'entrée."""
+        cache = TTLCache()
+        cache.set(1, "valeur")
+
+        cache.invalidate(1)
+
+        assert cache.get(1) is None
+
+    def test_invalidate_missing_key_is_noop(self):
+        """Test que invalidate sur une clé absente ne lève pas d'erreur."""
+        cache = TTLCache()
+
+        cache.invalidate(9999)
+
+    def test_clear_empties_cache(self):
+        """Test que clear vide toutes les entrées."""
+        cache = TTLCache()
+        cache.set(1, "a")
+        cache.set(2, "b")
+
+        cache.clear()
+
+        assert cache.get(1) is None
+        assert cache.get(2) is None
+
+    def test_maxsize_evicts_oldest_entry(self):
+        """Test que la plus ancienne entrée est évincée quand le cache est plein."""
+        cache = TTLCache(maxsize=2)
+        cache.set(1, "a")
+        cache.set(2, "b")
+        cache.set(3, "c")
+
+        assert cache.get(1) is None
+        assert cache.get(2) == "b"
+        assert cache.get(3) == "c"
@@ -33,9 +33,17 @@ class TestDatabaseConfiguration:
 
     def test_pool_size_constant(self):
         """Test que POOL_SIZE est défini."""
-        assert POOL_SIZE == 10
+        assert POOL_SIZE == 20
         assert isinstance(POOL_SIZE, int)
 
+    def test_pool_tuning_constants(self):
+        """Test que les paramètres du pool de connexions sont définis."""
+        from app.database import MAX_OVERFLOW, POOL_RECYCLE, POOL_TIMEOUT
+
+        assert MAX_OVERFLOW == 10
+        assert POOL_TIMEOUT == 30
+        assert POOL_RECYCLE == 3600
+
 
 class TestGetDbFunction:
     """Tests pour la fonction get_db avec une base de test."""
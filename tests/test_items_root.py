@@ -1,7 +1,7 @@
 """Tests pour les routes API des items."""
 
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.models.item import Item
 
@@ -23,7 +23,7 @@ class TestGetItemsRoute:
         item2 = Item(nom="Souris", prix=29.99)
         session.add(item1)
         session.add(item2)
-        session.commit()
+        session.flush()
 
         response = client.get("/items/")
 
@@ -35,11 +35,9 @@ class TestGetItemsRoute:
 
     def test_get_items_with_pagination_skip(self, client: TestClient, session: Session):
         """Test la pagination avec le paramètre skip."""
-        # Créer 5 items
-        for i in range(5):
-            item = Item(nom=f"Item {i}", prix=float(i * 10))
-            session.add(item)
-        session.commit()
+        # Créer 5 items en une seule passe
+        session.add_all([Item(nom=f"Item {i}", prix=float(i * 10)) for i in range(5)])
+        session.flush()
 
         response = client.get("/items/?skip=2")
 
@@ -52,7 +50,7 @@ class TestGetItemsRoute:
         """Test que la réponse correspond au modèle ItemResponse."""
         item = Item(nom="Test Item", prix=49.99)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
 
         response = client.get("/items/")
@@ -73,7 +71,7 @@ class TestGetItemRoute:
         """Test la récupération d'un item existant."""
         item = Item(nom="Écran", prix=299.99)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
 
         response = client.get(f"/items/{item.id}")
@@ -155,7 +153,7 @@ class TestUpdateItemRoute:
         """Test que la validation s'applique lors de la mise à jour."""
         item = Item(nom="Test", prix=50.0)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
 
         # Prix négatif
@@ -176,7 +174,7 @@ class TestDeleteItemRoute:
         """Test la suppression réussie d'un item."""
         item = Item(nom="À Supprimer", prix=25.0)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
 
         response = client.delete(f"/items/{item.id}")
@@ -190,7 +188,7 @@ class TestDeleteItemRoute:
         """Test que l'item est bien supprimé de la base."""
         item = Item(nom="À Supprimer", prix=25.0)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
         item_id = item.id
 
@@ -211,7 +209,7 @@ class TestDeleteItemRoute:
         """Test qu'on ne peut pas supprimer deux fois le même item."""
         item = Item(nom="Test", prix=10.0)
         session.add(item)
-        session.commit()
+        session.flush()
         session.refresh(item)
 
         # Première suppression
@@ -221,3 +219,149 @@ class TestDeleteItemRoute:
         # Deuxième suppression
         response2 = client.delete(f"/items/{item.id}")
         assert response2.status_code == 404
+
+
+class TestCachingHeaders:
+    """Tests pour les en-têtes de cache HTTP (ETag / 304)."""
+
+    def test_get_items_returns_etag(self, client: TestClient):
+        """Test que GET /items/ renvoie un en-tête ETag."""
+        response = client.get("/items/")
+
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    def test_get_items_if_none_match_returns_304(self, client: TestClient):
+        """Test qu'un If-None-Match à jour renvoie 304 sans corps."""
+        first = client.get("/items/")
+        etag = first.headers["etag"]
+
+        response = client.get("/items/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_get_item_if_none_match_returns_304(
+        self, client: TestClient, session: Session
+    ):
+        """Test le 304 sur GET /items/{id} avec un ETag valide."""
+        item = Item(nom="Cache Test", prix=15.0)
+        session.add(item)
+        session.flush()
+        session.refresh(item)
+
+        first = client.get(f"/items/{item.id}")
+        etag = first.headers["etag"]
+
+        response = client.get(f"/items/{item.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_etag_changes_when_data_changes(self, client: TestClient, session: Session):
+        """Test que l'ETag change quand les données changent."""
+        first = client.get("/items/")
+
+        item = Item(nom="Nouveau", prix=5.0)
+        session.add(item)
+        session.flush()
+
+        second = client.get("/items/")
+
+        assert first.headers["etag"] != second.headers["etag"]
+
+    def test_etag_is_quoted(self, client: TestClient):
+        """Test que l'ETag est entre guillemets (RFC 9110)."""
+        response = client.get("/items/")
+        etag = response.headers["etag"]
+
+        assert etag.startswith('"')
+        assert etag.endswith('"')
+
+    def test_if_none_match_weak_prefix_matches(self, client: TestClient):
+        """Test qu'un If-None-Match affaibli par un proxy (W/) matche."""
+        first = client.get("/items/")
+        etag = first.headers["etag"]
+
+        response = client.get("/items/", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+
+    def test_if_none_match_list_matches(self, client: TestClient):
+        """Test qu'un If-None-Match en liste est examiné valeur par valeur."""
+        first = client.get("/items/")
+        etag = first.headers["etag"]
+
+        response = client.get("/items/", headers={"If-None-Match": f'"autre", {etag}'})
+
+        assert response.status_code == 304
+
+
+class TestBulkCreateRoute:
+    """Tests pour la route POST /items/bulk."""
+
+    def test_bulk_create_items(self, client: TestClient, session: Session):
+        """Test la création de plusieurs items en une seule requête."""
+        items_data = [
+            {"nom": "Clavier", "prix": 49.99},
+            {"nom": "Souris", "prix": 29.99},
+            {"nom": "Tapis", "prix": 9.99},
+        ]
+
+        response = client.post("/items/bulk", json=items_data)
+
+        assert response.status_code == 201
+        assert response.json() == {"created": 3}
+
+        items = session.exec(select(Item)).all()
+        assert len(items) == 3
+
+    def test_bulk_create_empty_list(self, client: TestClient):
+        """Test qu'une liste vide ne crée rien."""
+        response = client.post("/items/bulk", json=[])
+
+        assert response.status_code == 201
+        assert response.json() == {"created": 0}
+
+    def test_bulk_create_validation_applies(self, client: TestClient):
+        """Test que la validation s'applique à chaque élément du lot."""
+        items_data = [
+            {"nom": "Valide", "prix": 10.0},
+            {"nom": "", "prix": 10.0},  # nom vide
+        ]
+
+        response = client.post("/items/bulk", json=items_data)
+
+        assert response.status_code == 422
+
+
+class TestKeysetPagination:
+    """Tests pour la pagination keyset via after_id."""
+
+    def test_get_items_after_id(self, client: TestClient, session: Session):
+        """Test que after_id retourne les items suivants."""
+        session.add_all([Item(nom=f"Item {i}", prix=float(i * 10)) for i in range(5)])
+        session.flush()
+
+        first_page = client.get("/items/?limit=2").json()
+        last_id = first_page[-1]["id"]
+
+        response = client.get(f"/items/?after_id={last_id}&limit=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert all(item["id"] > last_id for item in data)
+
+    def test_get_items_after_last_id_is_empty(
+        self, client: TestClient, session: Session
+    ):
+        """Test qu'après le dernier id la page est vide."""
+        item = Item(nom="Seul", prix=10.0)
+        session.add(item)
+        session.flush()
+        session.refresh(item)
+
+        response = client.get(f"/items/?after_id={item.id}")
+
+        assert response.status_code == 200
+        assert response.json() == []
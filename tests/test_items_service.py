@@ -233,3 +233,26 @@ class TestItemServiceDelete:
         items = ItemService.get_all(session)
         assert len(items) == 1
         assert items[0].nom == "Item 2"
+
+
+class TestItemServiceGetAfter:
+    """Tests pour la méthode get_after du service (pagination keyset)."""
+
+    def test_get_after_returns_following_items(self, session: Session):
+        """Test que get_after retourne les items après l'id donné."""
+        session.add_all([Item(nom=f"Item {i}", prix=float(i * 10)) for i in range(5)])
+        session.commit()
+
+        all_items = ItemService.get_all(session)
+        pivot_id = all_items[1].id
+
+        items = ItemService.get_after(session, after_id=pivot_id, limit=2)
+
+        assert len(items) == 2
+        assert all(item.id > pivot_id for item in items)
+
+    def test_get_after_empty_database(self, session: Session):
+        """Test que get_after retourne une liste vide si la base est vide."""
+        items = ItemService.get_after(session, after_id=0)
+
+        assert items == []
@@ -201,3 +201,28 @@ class TestItemResponseSchema:
         # Prix zéro
         with pytest.raises(ValidationError):
             ItemResponse(id=1, nom="Test", prix=0.0)
+
+
+class TestSchemaStrictness:
+    """Tests pour le rejet des champs inconnus (extra="forbid")."""
+
+    def test_item_create_rejects_extra_fields(self):
+        """Test qu'un champ inconnu est rejeté à la création."""
+        with pytest.raises(ValidationError):
+            ItemCreate(nom="Test", prix=10.0, inconnu="valeur")
+
+    def test_item_update_rejects_extra_fields(self):
+        """Test qu'un champ inconnu est rejeté à la mise à jour."""
+        with pytest.raises(ValidationError):
+            ItemUpdate(inconnu="valeur")
+
+    def test_item_create_strips_whitespace(self):
+        """Test que les espaces autour du nom sont retirés."""
+        item_data = ItemCreate(nom="  Aspirateur  ", prix=89.99)
+
+        assert item_data.nom == "Aspirateur"
+
+    def test_item_create_whitespace_only_nom_is_invalid(self):
+        """Test qu'un nom composé uniquement d'espaces est rejeté."""
+        with pytest.raises(ValidationError):
+            ItemCreate(nom="   ", prix=10.0)